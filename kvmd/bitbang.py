@@ -21,14 +21,25 @@
 
 
 # =====
-def make_crc16(data: bytes) -> int:
-    crc = 0xFFFF
-    for byte in data:
-        crc = crc ^ byte
+def _make_crc16_table() -> tuple[int, ...]:
+    table: list[int] = []
+    for byte in range(256):
+        crc = byte
         for _ in range(8):
             if crc & 0x0001 == 0:
                 crc = crc >> 1
             else:
                 crc = crc >> 1
                 crc = crc ^ 0xA001
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC16_TABLE = _make_crc16_table()
+
+
+def make_crc16(data: bytes) -> int:
+    crc = 0xFFFF
+    for byte in data:
+        crc = (crc >> 8) ^ _CRC16_TABLE[(crc ^ byte) & 0xFF]
     return crc
@@ -378,7 +378,6 @@ class BaseMcuHid(BaseHid, multiprocessing.Process):  # pylint: disable=too-many-
         return False
 
     def __process_request(self, conn: BasePhyConnection, req: bytes) -> bool:  # pylint: disable=too-many-branches
-        logger = get_logger()
         error_messages: list[str] = []
         live_log_errors = False
 
@@ -417,15 +416,10 @@ class BaseMcuHid(BaseHid, multiprocessing.Process):  # pylint: disable=too-many-
             except _RequestError as ex:
                 common_retries -= 1
 
-                if live_log_errors:
-                    logger.error(ex.msg)
-                else:
-                    error_messages.append(ex.msg)
-                    if len(error_messages) > self.__errors_threshold:
-                        for msg in error_messages:
-                            logger.error(msg)
-                        error_messages = []
-                        live_log_errors = True
+                error_messages.append(ex.msg)
+                if live_log_errors or len(error_messages) > self.__errors_threshold:
+                    self.__log_errors(error_messages)
+                    live_log_errors = True
 
                 if isinstance(ex, _PermRequestError):
                     error_retval = True
@@ -434,18 +428,26 @@ class BaseMcuHid(BaseHid, multiprocessing.Process):  # pylint: disable=too-many-
                 self.__set_state_online(False)
 
                 if common_retries and read_retries:
-                    time.sleep(self.__retries_delay)
+                    # Retry the first transient error almost immediately, the next ones after retries_delay
+                    time.sleep(0.01 if common_retries == self.__common_retries - 1 else self.__retries_delay)
 
         if not self.__gpio.is_powered():
             self.__set_state_online(False)
             return True
 
-        for msg in error_messages:
-            logger.error(msg)
         if not (common_retries and read_retries):
-            logger.error("Can't process HID request due many errors: %r", req)
+            error_messages.append(f"Can't process HID request due many errors: {req!r}")
+        self.__log_errors(error_messages)
         return error_retval
 
+    def __log_errors(self, error_messages: list[str]) -> None:
+        # The logger is resolved only here, on the error paths
+        if error_messages:
+            logger = get_logger()
+            for msg in error_messages:
+                logger.error(msg)
+            error_messages.clear()
+
     def __set_state_online(self, online: bool) -> None:
         self.__state_flags.update(online=int(online))
 
@@ -21,6 +21,7 @@
 
 
 import dataclasses
+import functools
 import struct
 
 from ....keyboard.mappings import KEYMAP
@@ -44,10 +45,14 @@ _KEYBOARD_NAMES_TO_CODES = {
     "ps2":      0b00000011,
 }
 _KEYBOARD_CODES_TO_NAMES = tools.swapped_kvs(_KEYBOARD_NAMES_TO_CODES)
+_KEYBOARD_ACTIVE_NAMES = tuple(
+    _KEYBOARD_CODES_TO_NAMES.get(code, "disabled")
+    for code in range(0b00000111 + 1)
+)
 
 
 def get_active_keyboard(outputs: int) -> str:
-    return _KEYBOARD_CODES_TO_NAMES.get(outputs & 0b00000111, "disabled")
+    return _KEYBOARD_ACTIVE_NAMES[outputs & 0b00000111]
 
 
 @dataclasses.dataclass(frozen=True)
@@ -59,7 +64,7 @@ class SetKeyboardOutputEvent(BaseEvent):
 
     def make_request(self) -> bytes:
         code = _KEYBOARD_NAMES_TO_CODES.get(self.keyboard, 0)
-        return _make_request(struct.pack(">BBxxx", 0x03, code))
+        return _make_cached_request(struct.pack(">BBxxx", 0x03, code))
 
 
 # =====
@@ -71,10 +76,14 @@ _MOUSE_NAMES_TO_CODES = {
     "usb_win98": 0b00100000,
 }
 _MOUSE_CODES_TO_NAMES = tools.swapped_kvs(_MOUSE_NAMES_TO_CODES)
+_MOUSE_ACTIVE_NAMES = tuple(
+    _MOUSE_CODES_TO_NAMES.get(code << 3, "disabled")
+    for code in range((0b00111000 >> 3) + 1)
+)
 
 
 def get_active_mouse(outputs: int) -> str:
-    return _MOUSE_CODES_TO_NAMES.get(outputs & 0b00111000, "disabled")
+    return _MOUSE_ACTIVE_NAMES[(outputs & 0b00111000) >> 3]
 
 
 @dataclasses.dataclass(frozen=True)
@@ -85,7 +94,7 @@ class SetMouseOutputEvent(BaseEvent):
         assert not self.mouse or self.mouse in _MOUSE_NAMES_TO_CODES
 
     def make_request(self) -> bytes:
-        return _make_request(struct.pack(">BBxxx", 0x04, _MOUSE_NAMES_TO_CODES.get(self.mouse, 0)))
+        return _make_cached_request(struct.pack(">BBxxx", 0x04, _MOUSE_NAMES_TO_CODES.get(self.mouse, 0)))
 
 
 # =====
@@ -94,13 +103,13 @@ class SetConnectedEvent(BaseEvent):
     connected: bool
 
     def make_request(self) -> bytes:
-        return _make_request(struct.pack(">BBxxx", 0x05, int(self.connected)))
+        return _make_cached_request(struct.pack(">BBxxx", 0x05, int(self.connected)))
 
 
 # =====
 class ClearEvent(BaseEvent):
     def make_request(self) -> bytes:
-        return _make_request(b"\x10\x00\x00\x00\x00")
+        return _REQUEST_CLEAR
 
 
 @dataclasses.dataclass(frozen=True)
@@ -112,8 +121,22 @@ class KeyEvent(BaseEvent):
         assert self.name in KEYMAP
 
     def make_request(self) -> bytes:
-        code = KEYMAP[self.name].mcu.code
-        return _make_request(struct.pack(">BBBxx", 0x11, code, int(self.state)))
+        return _make_key_request(self.name, self.state)
+
+
+@functools.lru_cache(maxsize=256)
+def _make_key_request(name: str, state: bool) -> bytes:
+    code = KEYMAP[name].mcu.code
+    return _make_request(struct.pack(">BBBxx", 0x11, code, int(state)))
+
+
+_MOUSE_BUTTONS = {
+    "left":   (0b10000000, 0b00001000, True),
+    "right":  (0b01000000, 0b00000100, True),
+    "middle": (0b00100000, 0b00000010, True),
+    "up":     (0b10000000, 0b00001000, False),  # Back
+    "down":   (0b01000000, 0b00000100, False),  # Forward
+}
 
 
 @dataclasses.dataclass(frozen=True)
@@ -122,16 +145,10 @@ class MouseButtonEvent(BaseEvent):
     state: bool
 
     def __post_init__(self) -> None:
-        assert self.name in ["left", "right", "middle", "up", "down"]
+        assert self.name in _MOUSE_BUTTONS
 
     def make_request(self) -> bytes:
-        (code, state_pressed, is_main) = {
-            "left":   (0b10000000, 0b00001000, True),
-            "right":  (0b01000000, 0b00000100, True),
-            "middle": (0b00100000, 0b00000010, True),
-            "up":     (0b10000000, 0b00001000, False),  # Back
-            "down":   (0b01000000, 0b00000100, False),  # Forward
-        }[self.name]
+        (code, state_pressed, is_main) = _MOUSE_BUTTONS[self.name]
         if self.state:
             code |= state_pressed
         if is_main:
@@ -140,7 +157,7 @@ class MouseButtonEvent(BaseEvent):
         else:
             main_code = 0
             extra_code = code
-        return _make_request(struct.pack(">BBBxx", 0x13, main_code, extra_code))
+        return _make_cached_request(struct.pack(">BBBxx", 0x13, main_code, extra_code))
 
 
 @dataclasses.dataclass(frozen=True)
@@ -180,13 +197,19 @@ class MouseWheelEvent(BaseEvent):
 
     def make_request(self) -> bytes:
         # Горизонтальная прокрутка пока не поддерживается
-        return _make_request(struct.pack(">Bxbxx", 0x14, self.delta_y))
+        return _make_cached_request(struct.pack(">Bxbxx", 0x14, self.delta_y))
 
 
 # =====
 def check_response(resp: bytes) -> bool:
     assert len(resp) in (4, 8), resp
-    return (bitbang.make_crc16(resp[:-2]) == struct.unpack(">H", resp[-2:])[0])
+    return (bitbang.make_crc16(resp[:-2]) == int.from_bytes(resp[-2:], "big"))
+
+
+@functools.lru_cache(maxsize=256)
+def _make_cached_request(cmd: bytes) -> bytes:
+    # For the events with a small set of possible payloads
+    return _make_request(cmd)
 
 
 def _make_request(cmd: bytes) -> bytes:
@@ -200,5 +223,6 @@ def _make_request(cmd: bytes) -> bytes:
 # =====
 REQUEST_PING = _make_request(b"\x01\x00\x00\x00\x00")
 REQUEST_REPEAT = _make_request(b"\x02\x00\x00\x00\x00")
+_REQUEST_CLEAR = _make_request(b"\x10\x00\x00\x00\x00")
 
 RESPONSE_LEGACY_OK = b"\x33\x20" + struct.pack(">H", bitbang.make_crc16(b"\x33\x20"))
@@ -22,7 +22,6 @@
 
 import multiprocessing
 import queue
-import copy
 import time
 
 from typing import AsyncGenerator
@@ -50,6 +49,86 @@ from .mouse import Mouse
 from .keyboard import Keyboard
 
 
+# =====
+_MAX_BATCH = 32
+
+
+def _coalesce_cmds(cmds: list[bytes]) -> list[bytes]:
+    # Each frame takes ~12ms of the wire time on 9600 baud, so there is no reason
+    # to send an absolute move which is immediately overwritten by the next one.
+    # The frame is dropped only if it's a pure move between two absolute frames
+    # with the same buttons, so clicks and wheel scrolls keep their positions.
+    cmds = [
+        cmd
+        for (prev_cmd, cmd, next_cmd) in zip([b""] + cmds, cmds, cmds[1:] + [b""])
+        if not (
+            _is_absolute_cmd(cmd) and cmd[9] == 0
+            and _is_absolute_cmd(prev_cmd) and prev_cmd[4] == cmd[4]
+            and _is_absolute_cmd(next_cmd) and next_cmd[4] == cmd[4]
+        )
+    ]
+    merged: list[bytes] = []
+    for cmd in cmds:
+        if _is_keyboard_cmd(cmd) and len(merged) > 0 and merged[-1] == cmd:
+            # Keyboard reports are the full state, so the same report in a row
+            # (like the browser's autorepeat of a held key) changes nothing.
+            continue
+        # Never merge anything into a frame that changes the buttons,
+        # otherwise the click would happen after the merged movement.
+        if len(merged) > 1 and _get_buttons(merged[-2]) == _get_buttons(merged[-1]):
+            merged_cmd = _merge_cmds(merged[-1], cmd)
+            if merged_cmd is not None:
+                merged[-1] = merged_cmd
+                continue
+        merged.append(cmd)
+    return merged
+
+
+def _merge_cmds(prev_cmd: bytes, cmd: bytes) -> (bytes | None):
+    # Relative moves and wheel scrolls are additive, so the runs of them
+    # with the same buttons can be sent as a single frame.
+    if _is_relative_cmd(prev_cmd) and _is_relative_cmd(cmd) and prev_cmd[4] == cmd[4]:
+        deltas = _add_int8s(prev_cmd[5:], cmd[5:])
+        if deltas is not None:
+            return (cmd[:5] + deltas)
+    elif (
+        _is_absolute_cmd(prev_cmd) and _is_absolute_cmd(cmd)
+        and prev_cmd[9] != 0 and cmd[9] != 0
+        and prev_cmd[:9] == cmd[:9]
+    ):
+        wheel = _add_int8s(prev_cmd[9:], cmd[9:])
+        if wheel is not None:
+            return (cmd[:9] + wheel)
+    return None
+
+
+def _add_int8s(first: bytes, second: bytes) -> (bytes | None):
+    sums = [a + b for (a, b) in zip(_unpack_int8s(first), _unpack_int8s(second))]
+    if all(-127 <= value <= 127 for value in sums):
+        return bytes(value & 0xFF for value in sums)
+    return None
+
+
+def _unpack_int8s(data: bytes) -> list[int]:
+    return [(value - 256 if value > 127 else value) for value in data]
+
+
+def _get_buttons(cmd: bytes) -> int:
+    return (cmd[4] if _is_absolute_cmd(cmd) or _is_relative_cmd(cmd) else -1)
+
+
+def _is_keyboard_cmd(cmd: bytes) -> bool:
+    return (len(cmd) == 11 and cmd[1] == 0x02)
+
+
+def _is_absolute_cmd(cmd: bytes) -> bool:
+    return (len(cmd) == 10 and cmd[1] == 0x04)
+
+
+def _is_relative_cmd(cmd: bytes) -> bool:
+    return (len(cmd) == 8 and cmd[1] == 0x05)
+
+
 # =====
 class Plugin(BaseHid, multiprocessing.Process):  # pylint: disable=too-many-instance-attributes
     def __init__(  # pylint: disable=too-many-arguments,super-init-not-called
@@ -72,6 +151,7 @@ class Plugin(BaseHid, multiprocessing.Process):  # pylint: disable=too-many-inst
         self.__read_timeout = read_timeout
 
         self.__reset_required_event = multiprocessing.Event()
+        self.__clear_required_event = multiprocessing.Event()
         self.__cmd_queue: "multiprocessing.Queue[bytes]" = multiprocessing.Queue()
 
         self.__notifier = aiomulti.AioProcessNotifier()
@@ -102,7 +182,7 @@ class Plugin(BaseHid, multiprocessing.Process):  # pylint: disable=too-many-inst
     async def get_state(self) -> dict:
         state = await self.__state_flags.get()
         absolute = self.__mouse.is_absolute()
-        leds = await self.__keyboard.get_leds()
+        leds = state["status"]
         return {
             "enabled": True,
             "online": state["online"],
@@ -110,7 +190,11 @@ class Plugin(BaseHid, multiprocessing.Process):  # pylint: disable=too-many-inst
             "connected": None,
             "keyboard": {
                 "online": state["online"],
-                "leds": leds,
+                "leds": {
+                    "num":    bool(leds & 0b00000001),
+                    "caps":   bool(leds & 0b00000010),
+                    "scroll": bool(leds & 0b00000100),
+                },
                 "outputs": {"available": [], "active": ""},
             },
             "mouse": {
@@ -134,7 +218,7 @@ class Plugin(BaseHid, multiprocessing.Process):  # pylint: disable=too-many-inst
                 prev = {}
             new = await self.get_state()
             if new != prev:
-                prev = copy.deepcopy(new)
+                prev = new  # get_state() builds a new tree every time, the copy is not needed
                 yield new
 
     async def reset(self) -> None:
@@ -185,6 +269,7 @@ class Plugin(BaseHid, multiprocessing.Process):  # pylint: disable=too-many-inst
 
     def _clear_events(self) -> None:
         tools.clear_queue(self.__cmd_queue)
+        self.__clear_required_event.set()
 
     def __queue_cmd(self, cmd: bytes, clear: bool=False) -> None:
         if not self.__stop_event.is_set():
@@ -208,25 +293,48 @@ class Plugin(BaseHid, multiprocessing.Process):  # pylint: disable=too-many-inst
         while not self.__stop_event.is_set():
             try:
                 with self.__chip.connected() as conn:
-                    while not (self.__stop_event.is_set() and self.__cmd_queue.qsize() == 0):
+                    while not self.__stop_event.is_set():
                         if self.__reset_required_event.is_set():
                             try:
                                 self.__set_state_busy(True)
                                 # self.__process_request(conn, RESET)
                             finally:
                                 self.__reset_required_event.clear()
-                        try:
-                            cmd = self.__cmd_queue.get(timeout=0.1)
-                            # get_logger(0).info(f"HID : cmd = {cmd}")
-                        except queue.Empty:
+                        self.__clear_required_event.clear()
+                        cmds = self.__get_cmds(0.1)
+                        if len(cmds) == 0:
                             self.__process_cmd(conn, b"")
-                        else:
+                        for cmd in cmds:
+                            # The batch (up to ~0.4s of input on 9600 baud) is already off the queue,
+                            # so _clear_events() can't drop it and it's checked here instead. A clear racing
+                            # with __get_cmds() may also drop the events queued right after it.
+                            # It's an accepted trade-off for the batching, like the FIXME in __queue_cmd().
+                            if self.__clear_required_event.is_set():
+                                break
+                            self.__process_cmd(conn, cmd)
+
+                    # Flush the commands queued before the stop
+                    while True:
+                        cmds = self.__get_cmds(0)
+                        if len(cmds) == 0:
+                            break
+                        for cmd in cmds:
                             self.__process_cmd(conn, cmd)
             except Exception:
                 self.clear_events()
                 get_logger(0).exception("Unexpected error in the HID loop")
                 time.sleep(2)
 
+    def __get_cmds(self, timeout: float) -> list[bytes]:
+        cmds: list[bytes] = []
+        try:
+            cmds.append(self.__cmd_queue.get(timeout=timeout))
+            while len(cmds) < _MAX_BATCH:
+                cmds.append(self.__cmd_queue.get_nowait())
+        except queue.Empty:
+            pass
+        return _coalesce_cmds(cmds)
+
     def __process_cmd(self, conn: ChipConnection, cmd: bytes) -> bool:  # pylint: disable=too-many-branches
         try:
             led_byte = conn.xfer(cmd)
@@ -236,9 +344,9 @@ class Plugin(BaseHid, multiprocessing.Process):  # pylint: disable=too-many-inst
             time.sleep(2)
         else:
             if led_byte >= 0:
-                self.__keyboard.set_leds(led_byte)
-                self.__notifier.notify()
-            self.__set_state_online(True)
+                self.__state_flags.update(online=1, status=led_byte)
+            else:
+                self.__set_state_online(True)
             return True
         return False
 
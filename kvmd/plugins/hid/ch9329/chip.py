@@ -42,22 +42,19 @@ class ChipConnection:
 
     def __send(self, cmd: bytes) -> None:
         # RESET = [0x00,0x0F,0x00]
-        # GET_INFO = [0x00,0x01,0x00]
-        if len(cmd) == 0:
-            cmd = b"\x00\x01\x00"
-        cmd = b"\x57\xAB" + cmd
-        cmd += self.__make_checksum(cmd).to_bytes(1, "big")
-        self.__tty.write(cmd)
+        self.__tty.write(_make_request(cmd) if len(cmd) > 0 else _REQUEST_GET_INFO)
 
     def __recv(self) -> int:
-        data = self.__tty.read(5)
-        if len(data) < 5:
+        # The shortest response is the header, one status byte and the checksum,
+        # so the replies for keyboard and mouse commands are read at once
+        data = self.__tty.read(7)
+        if len(data) < 7:
             raise ChipResponseError("Too short response, HID might be disconnected")
 
-        if data and data[4]:
-            data += self.__tty.read(data[4] + 1)
+        if data[4] > 1:
+            data += self.__tty.read(data[4] - 1)
 
-        if self.__make_checksum(data[:-1]) != data[-1]:
+        if _make_checksum(data[:-1]) != data[-1]:
             raise ChipResponseError("Invalid response checksum")
 
         if data[4] == 1 and data[5] != 0:
@@ -66,9 +63,6 @@ class ChipConnection:
         # led_byte (info) response
         return (data[7] if data[3] == 0x81 else -1)
 
-    def __make_checksum(self, cmd: bytes) -> int:
-        return (sum(cmd) % 256)
-
 
 class Chip:
     def __init__(self, device_path: str, speed: int, read_timeout: float) -> None:
@@ -79,4 +73,20 @@ class Chip:
     @contextlib.contextmanager
     def connected(self) -> Generator[ChipConnection, None, None]:  # type: ignore
         with serial.Serial(self.__device_path, self.__speed, timeout=self.__read_timeout) as tty:
+            with contextlib.suppress(ValueError, OSError):
+                # Don't wait for the tty flush timer on RX. Not every USB-UART driver supports it.
+                tty.set_low_latency_mode(True)
             yield ChipConnection(tty)
+
+
+# =====
+def _make_request(cmd: bytes) -> bytes:
+    req = b"\x57\xAB" + cmd
+    return (req + bytes((_make_checksum(req),)))
+
+
+def _make_checksum(data: bytes) -> int:
+    return (sum(data) & 0xFF)
+
+
+_REQUEST_GET_INFO = _make_request(b"\x00\x01\x00")
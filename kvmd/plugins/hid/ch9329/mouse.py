@@ -20,18 +20,31 @@
 # ========================================================================== #
 
 
-import math
+import struct
 
 from ....mouse import MouseRange
 
 
+# =====
+_BUTTONS = {
+    "left":   0x01,
+    "right":  0x02,
+    "middle": 0x04,
+    "up":     0x08,
+    "down":   0x10,
+}
+
+
 # =====
 class Mouse:  # pylint: disable=too-many-instance-attributes
+    __absolute_struct = struct.Struct("<BBBBBHHB")  # Little-endian 16-bit coords
+    __relative_struct = struct.Struct("<BBBBBBBB")
+
     def __init__(self) -> None:
         self.__absolute = True
         self.__buttons = 0
-        self.__to_x = (0, 0)
-        self.__to_y = (0, 0)
+        self.__to_x = 0
+        self.__to_y = 0
         self.__delta_x = 0
         self.__delta_y = 0
         self.__wheel_y = 0
@@ -43,18 +56,7 @@ class Mouse:  # pylint: disable=too-many-instance-attributes
         return self.__absolute
 
     def process_button(self, button: str, state: bool) -> bytes:
-        code = 0x00
-        match button:
-            case "left":
-                code = 0x01
-            case "right":
-                code = 0x02
-            case "middle":
-                code = 0x04
-            case "up":
-                code = 0x08
-            case "down":
-                code = 0x10
+        code = _BUTTONS.get(button, 0)
         if code:
             if state:
                 self.__buttons |= code
@@ -72,10 +74,9 @@ class Mouse:  # pylint: disable=too-many-instance-attributes
         self.__wheel_y = 0
         return self.__make_absolute_cmd()
 
-    def __fix_absolute(self, value: int) -> tuple[int, int]:
+    def __fix_absolute(self, value: int) -> int:
         assert MouseRange.MIN <= value <= MouseRange.MAX
-        to_fixed = math.ceil(MouseRange.remap(value, 0, MouseRange.MAX) / 8)
-        return (to_fixed >> 8, to_fixed & 0xFF)
+        return ((MouseRange.remap(value, 0, MouseRange.MAX) + 7) // 8)  # Ceil division
 
     def process_wheel(self, delta_x: int, delta_y: int) -> bytes:
         _ = delta_x
@@ -93,23 +94,21 @@ class Mouse:  # pylint: disable=too-many-instance-attributes
         return self.__make_relative_cmd()
 
     def __make_absolute_cmd(self) -> bytes:
-        return bytes([
+        return self.__absolute_struct.pack(
             0, 0x04, 0x07, 0x02,
             self.__buttons,
-            self.__to_x[1], self.__to_x[0],
-            self.__to_y[1], self.__to_y[0],
+            self.__to_x, self.__to_y,
             self.__wheel_y,
-        ])
+        )
 
     def __make_relative_cmd(self) -> bytes:
-        return bytes([
+        return self.__relative_struct.pack(
             0, 0x05, 0x05, 0x01,
             self.__buttons,
             self.__delta_x, self.__delta_y,
             self.__wheel_y,
-        ])
+        )
 
     def __fix_relative(self, value: int) -> int:
         assert -127 <= value <= 127
-        value = math.ceil(value / 3)
-        return (value if value >= 0 else (255 + value))
+        return ((-(-value // 3)) & 0xFF)  # Ceil division, then int8 two's complement
@@ -46,6 +46,10 @@ from ._mcu import BasePhy
 from ._mcu import BaseMcuHid
 
 
+# =====
+_ZEROS = tuple(b"\x00" * size for size in range(11))
+
+
 # =====
 class _SpiPhyConnection(BasePhyConnection):
     def __init__(
@@ -55,35 +59,34 @@ class _SpiPhyConnection(BasePhyConnection):
     ) -> None:
 
         self.__xfer = xfer
-        self.__read_timeout = read_timeout
+        self.__read_timeout_ns = int(read_timeout * 1_000_000_000)
 
     def send(self, req: bytes) -> bytes:
         assert len(req) == 8
         assert req[0] == 0x33
 
-        deadline_ts = time.monotonic() + self.__read_timeout
-        dummy = b"\x00" * 10
-        while time.monotonic() < deadline_ts:
-            if bytes(self.__xfer(dummy)) == dummy:
+        # Integer deadlines and local names for the busy loops
+        monotonic_ns = time.monotonic_ns
+        xfer = self.__xfer
+
+        deadline_ns = monotonic_ns() + self.__read_timeout_ns
+        dummy = _ZEROS[10]
+        while monotonic_ns() < deadline_ns:
+            if bytes(xfer(dummy)) == dummy:
                 break
         else:
             get_logger(0).error("SPI timeout reached while garbage reading")
             return b""
 
-        self.__xfer(req)
-
-        resp: list[int] = []
-        deadline_ts = time.monotonic() + self.__read_timeout
-        found = False
-        while time.monotonic() < deadline_ts:
-            for byte in self.__xfer(b"\x00" * (9 - len(resp))):
-                if not found:
-                    if byte == 0:
-                        continue
-                    found = True
-                resp.append(byte)
-                if len(resp) == 8:
-                    break
+        xfer(req)
+
+        resp = bytearray()
+        deadline_ns = monotonic_ns() + self.__read_timeout_ns
+        while monotonic_ns() < deadline_ns:
+            data = bytes(xfer(_ZEROS[9 - len(resp)]))
+            if len(resp) == 0:
+                data = data.lstrip(b"\x00")  # Skip zeros before the response
+            resp += data[:8 - len(resp)]
             if len(resp) == 8:
                 break
         else:
@@ -139,7 +142,7 @@ class _SpiPhy(BasePhy):  # pylint: disable=too-many-instance-attributes
                 if self.__sw_cs_per_byte:
                     # Режим для Pico, когда CS должен взводиться для отдельных байтов
                     def xfer(data: bytes) -> bytes:
-                        got: list[int] = []
+                        got = bytearray()
                         for byte in data:
                             got.extend(inner_xfer(byte.to_bytes(1, "big")))
                         return bytes(got)
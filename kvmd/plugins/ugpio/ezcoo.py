@@ -20,7 +20,6 @@
 # ========================================================================== #
 
 
-import re
 import multiprocessing
 import functools
 import errno
@@ -48,6 +47,17 @@ from . import GpioDriverOfflineError
 from . import BaseUserGpioDriver
 
 
+# =====
+_CHANNELS = {
+    b"V0CS": 0,
+    b"V18S": 1,
+    b"V5ES": 2,
+    b"V08S": 3,
+}
+
+_HEX_DIGITS = frozenset(b"0123456789abcdefABCDEF")
+
+
 # =====
 class Plugin(BaseUserGpioDriver):  # pylint: disable=too-many-instance-attributes
     def __init__(
@@ -66,7 +76,11 @@ class Plugin(BaseUserGpioDriver):  # pylint: disable=too-many-instance-attribute
         self.__device_path = device_path
         self.__speed = speed
         self.__read_timeout = read_timeout
-        self.__protocol = protocol
+
+        self.__cmds = tuple(
+            (b"%s OUT1 VS IN%d\n" % ((b"SET" if protocol == 1 else b"EZS"), channel + 1)) * 2  # Twice because of ezcoo bugs
+            for channel in range(4)
+        )
 
         self.__ctl_queue: "multiprocessing.Queue[int]" = multiprocessing.Queue()
         self.__channel_queue: "multiprocessing.Queue[int | None]" = multiprocessing.Queue()
@@ -165,24 +179,19 @@ class Plugin(BaseUserGpioDriver):  # pylint: disable=too-many-instance-attribute
         channel: (int | None) = None
         if tty.in_waiting:
             data += tty.read_all()
-            found = re.findall(b"V[0-9a-fA-F]{2}S", data)
-            if found:
-                channel = {
-                    b"V0CS": 0,
-                    b"V18S": 1,
-                    b"V5ES": 2,
-                    b"V08S": 3,
-                }.get(found[-1], -1)
+            # Search for the last b"V[0-9a-fA-F]{2}S" from the end
+            end = len(data)
+            while (index := data.rfind(b"S", 0, end)) >= 3:
+                if data[index - 3] == ord("V") and data[index - 2] in _HEX_DIGITS and data[index - 1] in _HEX_DIGITS:
+                    channel = _CHANNELS.get(data[index - 3:index + 1], -1)
+                    break
+                end = index
             data = data[-8:]
         return (channel, data)
 
     def __send_channel(self, tty: serial.Serial, channel: int) -> None:
         assert 0 <= channel <= 3
-        cmd = b"%s OUT1 VS IN%d\n" % (
-            (b"SET" if self.__protocol == 1 else b"EZS"),
-            channel + 1,
-        )
-        tty.write(cmd * 2)  # Twice because of ezcoo bugs
+        tty.write(self.__cmds[channel])
         tty.flush()
 
     def __str__(self) -> str:
@@ -68,6 +68,11 @@ class Plugin(BaseUserGpioDriver):  # pylint: disable=too-many-instance-attribute
         self.__speed = speed
         self.__read_timeout = read_timeout
         self.__protocol = protocol  # https://github.com/pikvm/kvmd/pull/158
+        self.__channel_rx = re.compile(rb"AG0([1-4])gA" if protocol == 1 else rb"G0([1-4])gA\x00")
+        self.__cmds = tuple(
+            ("SW{port}\r\nAG{port:02d}gA" if protocol == 1 else "G{port:02d}gA\x00").format(port=(channel + 1)).encode()
+            for channel in range(4)
+        )
 
         self.__ctl_queue: "multiprocessing.Queue[int]" = multiprocessing.Queue()
         self.__channel_queue: "multiprocessing.Queue[int | None]" = multiprocessing.Queue()
@@ -172,19 +177,15 @@ class Plugin(BaseUserGpioDriver):  # pylint: disable=too-many-instance-attribute
         channel: (int | None) = None
         if tty.in_waiting:
             data += tty.read_all()
-            found = re.findall((b"AG0[1-4]gA" if self.__protocol == 1 else b"G0[1-4]gA\x00"), data)
+            found = self.__channel_rx.findall(data)
             if found:
-                try:
-                    channel = int(found[-1][2:4] if self.__protocol == 1 else found[-1][1:3]) - 1
-                except Exception:
-                    channel = None
+                channel = int(found[-1]) - 1
             data = data[-12:]
         return (channel, data)
 
     def __send_channel(self, tty: serial.Serial, channel: int) -> None:
         assert 0 <= channel <= 3
-        cmd = ("SW{port}\r\nAG{port:02d}gA" if self.__protocol == 1 else "G{port:02d}gA\x00")
-        tty.write(cmd.format(port=(channel + 1)).encode())
+        tty.write(self.__cmds[channel])
         tty.flush()
 
     def __str__(self) -> str:
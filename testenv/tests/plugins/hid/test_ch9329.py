@@ -0,0 +1,175 @@
+# ========================================================================== #
+#                                                                            #
+#    KVMD - The main PiKVM daemon.                                           #
+#                                                                            #
+#    Copyright (C) 2018-2024  Maxim Devaev <mdevaev@gmail.com>               #
+#                                                                            #
+#    This program is free software: you can redistribute it and/or modify    #
+#    it under the terms of the GNU General Public License as published by    #
+#    the Free Software Foundation, either version 3 of the License, or       #
+#    (at your option) any later version.                                     #
+#                                                                            #
+#    This program is distributed in the hope that it will be useful,         #
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of          #
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the           #
+#    GNU General Public License for more details.                            #
+#                                                                            #
+#    You should have received a copy of the GNU General Public License       #
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.  #
+#                                                                            #
+# ========================================================================== #
+
+
+import struct
+
+import pytest
+
+from kvmd.plugins.hid.ch9329 import _coalesce_cmds
+from kvmd.plugins.hid.ch9329 import _merge_cmds
+from kvmd.plugins.hid.ch9329 import _add_int8s
+from kvmd.plugins.hid.ch9329 import _get_buttons
+from kvmd.plugins.hid.ch9329 import _is_keyboard_cmd
+from kvmd.plugins.hid.ch9329 import _is_absolute_cmd
+from kvmd.plugins.hid.ch9329 import _is_relative_cmd
+
+
+# =====
+def _kbd(*keys: int) -> bytes:
+    return b"\x00\x02\x08\x00\x00" + bytes(keys).ljust(6, b"\x00")
+
+
+def _abs(x: int, y: int, buttons: int=0, wheel: int=0) -> bytes:
+    return struct.pack("<BBBBBHHB", 0, 0x04, 0x07, 0x02, buttons, x, y, wheel & 0xFF)
+
+
+def _rel(dx: int, dy: int, buttons: int=0, wheel: int=0) -> bytes:
+    return bytes((0, 0x05, 0x05, 0x01, buttons, dx & 0xFF, dy & 0xFF, wheel & 0xFF))
+
+
+# =====
+def test_ok__is_keyboard_cmd() -> None:
+    assert _is_keyboard_cmd(_kbd(4))
+    assert not _is_keyboard_cmd(_kbd(4)[:-1])
+    assert not _is_keyboard_cmd(_abs(1, 1))
+
+
+def test_ok__is_absolute_cmd() -> None:
+    assert _is_absolute_cmd(_abs(1, 1))
+    assert not _is_absolute_cmd(_abs(1, 1)[:-1])
+    assert not _is_absolute_cmd(b"\x00\x05" + _abs(1, 1)[2:])
+    assert not _is_absolute_cmd(_rel(1, 1))
+
+
+def test_ok__is_relative_cmd() -> None:
+    assert _is_relative_cmd(_rel(1, 1))
+    assert not _is_relative_cmd(_rel(1, 1)[:-1])
+    assert not _is_relative_cmd(_abs(1, 1))
+
+
+def test_ok__get_buttons() -> None:
+    assert _get_buttons(_abs(1, 1, buttons=0x01)) == 0x01
+    assert _get_buttons(_rel(1, 1, buttons=0x02)) == 0x02
+    assert _get_buttons(b"") == -1
+
+
+@pytest.mark.parametrize("first, second, retval", [
+    (b"\x0a\xf6", b"\xec\x1e", b"\xf6\x14"),
+    (b"\x7f\x00", b"\x80\x00", b"\xff\x00"),
+    (b"\x7f\x00", b"\x01\x00", None),
+    (b"\x81\x00", b"\xff\x00", None),
+])
+def test_ok__add_int8s(first: bytes, second: bytes, retval: (bytes | None)) -> None:
+    assert _add_int8s(first, second) == retval
+
+
+def test_ok__merge_cmds() -> None:
+    assert _merge_cmds(_rel(10, -10), _rel(-20, 30)) == _rel(-10, 20)
+    assert _merge_cmds(_rel(10, -10), _rel(10, 10, buttons=0x01)) is None
+    assert _merge_cmds(_abs(5, 5, wheel=1), _abs(5, 5, wheel=1)) == _abs(5, 5, wheel=2)
+    assert _merge_cmds(_abs(5, 5, wheel=1), _abs(6, 5, wheel=1)) is None
+    assert _merge_cmds(_abs(5, 5), _abs(6, 6)) is None
+    assert _merge_cmds(_kbd(4), _kbd(4)) is None
+
+
+def test_ok__coalesce_absolute_moves() -> None:
+    assert _coalesce_cmds([_abs(1, 1), _abs(2, 2), _abs(3, 3), _abs(4, 4)]) == [_abs(1, 1), _abs(4, 4)]
+
+
+def test_ok__coalesce_absolute_moves_around_buttons() -> None:
+    cmds = [
+        _abs(1, 1),
+        _abs(2, 2),
+        _abs(2, 2, buttons=0x01),
+        _abs(3, 3, buttons=0x01),
+        _abs(4, 4, buttons=0x01),
+        _abs(5, 5, buttons=0x01),
+        _abs(5, 5),
+        _abs(6, 6),
+    ]
+    assert _coalesce_cmds(cmds) == [
+        _abs(1, 1),
+        _abs(2, 2),
+        _abs(2, 2, buttons=0x01),
+        _abs(5, 5, buttons=0x01),
+        _abs(5, 5),
+        _abs(6, 6),
+    ]
+
+
+def test_ok__coalesce_click() -> None:
+    cmds = [_abs(10, 10), _abs(10, 10, buttons=0x01), _abs(20, 20, buttons=0x01), _abs(20, 20)]
+    assert _coalesce_cmds(cmds) == cmds
+
+
+def test_ok__coalesce_absolute_wheel_position() -> None:
+    cmds = [_abs(1, 1), _abs(2, 2), _abs(2, 2, wheel=-1), _abs(3, 3)]
+    assert _coalesce_cmds(cmds) == [_abs(1, 1), _abs(2, 2, wheel=-1), _abs(3, 3)]
+
+
+def test_ok__coalesce_absolute_wheel() -> None:
+    cmds = [_abs(1, 1), _abs(1, 1, wheel=-1), _abs(1, 1, wheel=-1), _abs(1, 1, wheel=-1)]
+    assert _coalesce_cmds(cmds) == [_abs(1, 1), _abs(1, 1, wheel=-3)]
+
+
+# =====
+def test_ok__coalesce_relative_run() -> None:
+    cmds = [_rel(1, 1), _rel(10, -10), _rel(-20, 30), _rel(5, 5)]
+    assert _coalesce_cmds(cmds) == [_rel(1, 1), _rel(-5, 25)]
+
+
+def test_ok__coalesce_relative_overflow() -> None:
+    cmds = [_rel(0, 0), _rel(100, 0), _rel(20, 0), _rel(20, 0), _rel(1, 0)]
+    assert _coalesce_cmds(cmds) == [_rel(0, 0), _rel(120, 0), _rel(21, 0)]
+
+
+def test_ok__coalesce_relative_buttons() -> None:
+    cmds = [
+        _rel(1, 1),
+        _rel(0, 0, buttons=0x01),
+        _rel(5, 5, buttons=0x01),
+        _rel(5, 5, buttons=0x01),
+        _rel(0, 0),
+        _rel(3, 3),
+    ]
+    assert _coalesce_cmds(cmds) == [
+        _rel(1, 1),
+        _rel(0, 0, buttons=0x01),
+        _rel(10, 10, buttons=0x01),
+        _rel(0, 0),
+        _rel(3, 3),
+    ]
+
+
+# =====
+def test_ok__coalesce_keyboard_repeat() -> None:
+    assert _coalesce_cmds([_kbd(4), _kbd(4), _kbd(4), _kbd()]) == [_kbd(4), _kbd()]
+
+
+def test_ok__coalesce_keyboard_press_release_press() -> None:
+    cmds = [_kbd(4), _kbd(), _kbd(4), _kbd()]
+    assert _coalesce_cmds(cmds) == cmds
+
+
+def test_ok__coalesce_keyboard_between_moves() -> None:
+    cmds = [_rel(1, 1), _rel(1, 1), _kbd(4), _kbd(4), _rel(1, 1), _rel(1, 1)]
+    assert _coalesce_cmds(cmds) == [_rel(1, 1), _rel(1, 1), _kbd(4), _rel(1, 1), _rel(1, 1)]